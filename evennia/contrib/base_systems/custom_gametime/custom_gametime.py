@@ -62,6 +62,23 @@ UNITS = getattr(
     },
 )
 
+# Unique unit lengths sorted from largest to smallest, without the seconds;
+# these are the divisors used to split a number of seconds into units.
+_UNITS_DESC = tuple(sorted(set(UNITS.values()), reverse=True))[:-1]
+# Maps a unit length in seconds to its position in `_UNITS_DESC` + (1,).
+_UNIT_INDEX = {seconds: index for index, seconds in enumerate(_UNITS_DESC + (1,))}
+# Real-world unit lengths in seconds, independent of the custom calendar.
+_REAL_MIN = 60
+_REAL_HOUR = 60 * 60
+_REAL_DAY = 60 * 60 * 24
+_REAL_WEEK = 60 * 60 * 24 * 7
+_REAL_MONTH = 60 * 60 * 24 * 365 // 12
+_REAL_YEAR = 60 * 60 * 24 * 365
+# The same lengths as divisors for `time_to_tuple`, from years down to minutes.
+_REAL_DIVISORS = (_REAL_YEAR, _REAL_MONTH, _REAL_WEEK, _REAL_DAY, _REAL_HOUR, _REAL_MIN)
+# All accepted unit names, including plurals (like mins instead of min).
+_UNIT_ALIASES = {**{f"{name}s": seconds for name, seconds in UNITS.items()}, **UNITS}
+
 
 def time_to_tuple(seconds, *divisors):
     """
@@ -81,11 +98,12 @@ def time_to_tuple(seconds, *divisors):
 
     """
     results = []
+    append = results.append
     seconds = int(seconds)
     for divisor in divisors:
-        results.append(seconds // divisor)
-        seconds %= divisor
-    results.append(seconds)
+        quotient, seconds = divmod(seconds, divisor)
+        append(quotient)
+    append(seconds)
     return tuple(results)
 
 
@@ -113,16 +131,13 @@ def gametime_to_realtime(format=False, **kwargs):
     # Dynamically creates the list of units based on kwarg names and UNITs list
     rtime = 0
     for name, value in kwargs.items():
-        # Allow plural names (like mins instead of min)
-        if name not in UNITS and name.endswith("s"):
-            name = name[:-1]
-
-        if name not in UNITS:
-            raise ValueError("the unit {} isn't defined as a valid " "game time unit".format(name))
-        rtime += value * UNITS[name]
+        try:
+            rtime += value * _UNIT_ALIASES[name]
+        except KeyError:
+            raise ValueError(f"the unit {name} isn't defined as a valid game time unit") from None
     rtime /= TIMEFACTOR
     if format:
-        return time_to_tuple(rtime, 31536000, 2628000, 604800, 86400, 3600, 60)
+        return time_to_tuple(rtime, *_REAL_DIVISORS)
     return rtime
 
 
@@ -161,19 +176,15 @@ def realtime_to_gametime(secs=0, mins=0, hrs=0, days=1, weeks=1, months=1, yrs=0
 
     gtime = TIMEFACTOR * (
         secs
-        + mins * 60
-        + hrs * 3600
-        + days * 86400
-        + weeks * 604800
-        + months * 2628000
-        + yrs * 31536000
+        + mins * _REAL_MIN
+        + hrs * _REAL_HOUR
+        + days * _REAL_DAY
+        + weeks * _REAL_WEEK
+        + months * _REAL_MONTH
+        + yrs * _REAL_YEAR
     )
     if format:
-        units = sorted(set(UNITS.values()), reverse=True)
-        # Remove seconds from the tuple
-        del units[-1]
-
-        return time_to_tuple(gtime, *units)
+        return time_to_tuple(gtime, *_UNITS_DESC)
     return gtime
 
 
@@ -192,9 +203,7 @@ def custom_gametime(absolute=False):
 
     """
     current = gametime.gametime(absolute=absolute)
-    units = sorted(set(UNITS.values()), reverse=True)
-    del units[-1]
-    return time_to_tuple(current, *units)
+    return time_to_tuple(current, *_UNITS_DESC)
 
 
 def real_seconds_until(**kwargs):
@@ -219,13 +228,10 @@ def real_seconds_until(**kwargs):
 
     """
     current = gametime.gametime(absolute=True)
-    units = sorted(set(UNITS.values()), reverse=True)
-    # Remove seconds from the tuple
-    del units[-1]
-    divisors = list(time_to_tuple(current, *units))
+    divisors = list(time_to_tuple(current, *_UNITS_DESC))
 
     # For each keyword, add in the unit's
-    units.append(1)
+    units = _UNITS_DESC + (1,)
     higher_unit = None
     for unit, value in kwargs.items():
         if unit in ("day", "week", "month"):
@@ -233,34 +239,23 @@ def real_seconds_until(**kwargs):
             value -= 1
 
         # Get the unit's index
-        if unit not in UNITS:
+        seconds = UNITS.get(unit)
+        if seconds is None:
             raise ValueError(f"Unknown unit '{unit}'. Allowed: {', '.join(UNITS)}")
 
-        seconds = UNITS[unit]
-        index = units.index(seconds)
+        index = _UNIT_INDEX[seconds]
         divisors[index] = value
         if higher_unit is None or higher_unit > index:
             higher_unit = index
 
     # Check the projected time
     # Note that it can be already passed (the given time may be in the past)
-    projected = 0
-    for i, value in enumerate(divisors):
-        seconds = units[i]
-        projected += value * seconds
+    projected = sum(value * seconds for value, seconds in zip(divisors, units))
 
     if projected <= current:
-        # The time is in the past, increase the higher unit
-        if higher_unit:
-            divisors[higher_unit - 1] += 1
-        else:
-            divisors[0] += 1
-
-    # Get the projected time again
-    projected = 0
-    for i, value in enumerate(divisors):
-        seconds = units[i]
-        projected += value * seconds
+        # The time is in the past, increase the higher unit (adding
+        # one of that unit directly to the projected time)
+        projected += units[higher_unit - 1 if higher_unit else 0]
 
     return (projected - current) / TIMEFACTOR
 
@@ -11,10 +11,17 @@ from evennia.utils.test_resources import BaseEvenniaTest
 from .. import custom_gametime
 
 
+_CALLS = []
+
+
 def _testcallback():
     pass
 
 
+def _countingcallback():
+    _CALLS.append(True)
+
+
 @patch("evennia.utils.gametime.gametime", new=Mock(return_value=2975000898.46))
 class TestCustomGameTime(BaseEvenniaTest):
     def tearDown(self):
@@ -31,6 +38,8 @@ class TestCustomGameTime(BaseEvenniaTest):
         self.assertEqual(
             custom_gametime.gametime_to_realtime(format=True, days=2), (0, 0, 0, 1, 0, 0, 0)
         )
+        with self.assertRaises(ValueError):
+            custom_gametime.gametime_to_realtime(fortnights=1)
 
     def test_realtime_to_gametime(self):
         self.assertEqual(custom_gametime.realtime_to_gametime(days=3, mins=34), 349680.0)
@@ -54,3 +63,14 @@ class TestCustomGameTime(BaseEvenniaTest):
     def test_schedule(self):
         self.timescript = custom_gametime.schedule(_testcallback, repeat=True, min=5, sec=0)
         self.assertEqual(self.timescript.interval, 1700.7699999809265)
+
+    def test_at_repeat(self):
+        del _CALLS[:]
+        self.timescript = custom_gametime.schedule(_countingcallback, repeat=True, min=5, sec=0)
+        # game time has moved on 100s since scheduling; the next fire re-aligns with it
+        with patch("evennia.utils.gametime.gametime", new=Mock(return_value=2975000998.46)):
+            self.timescript.at_repeat()
+            expected = custom_gametime.real_seconds_until(min=5, sec=0)
+        self.assertEqual(_CALLS, [True])
+        self.assertAlmostEqual(expected, 1650.77, places=2)
+        self.assertAlmostEqual(self.timescript.interval, expected, places=2)